@@ -6,10 +6,13 @@ from flask_cors import CORS
 import os
 
 from models import storage
+from api.v1.providers import OrjsonProvider
 from api.v1.views import app_views
 
 app = Flask(__name__)
-CORS(app, origins="0.0.0.0")
+app.json_provider_class = OrjsonProvider
+app.json = OrjsonProvider(app)
+CORS(app, resources={r"/api/v1/*": {"origins": "*"}}, send_wildcard=True)
 
 app.register_blueprint(app_views)
 
@@ -39,6 +42,20 @@ def close_db(expception):
     storage.close()
 
 
+def warm_up():
+    """Do the one-time work of the first request at startup.
+
+    Compiles the URL map, which werkzeug otherwise does lazily when the
+    first request is matched, and runs the JSON provider once.
+    """
+    app.url_map.update()
+    with app.app_context():
+        app.json.dumps({"status": "OK"})
+
+
+warm_up()
+
+
 if __name__ == "__main__":
     host = os.getenv("HBNB_API_HOST") or "0.0.0.0"
     port = os.getenv("HBNB_API_PORT") or 5000
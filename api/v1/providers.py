@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+"""JSON providers for the Flask application.
+
+Providers:
+    - OrjsonProvider
+"""
+
+from flask.json.provider import JSONProvider
+import orjson
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that encodes and decodes using orjson.
+
+    Every jsonify call and request.get_json call made by the app goes
+    through this provider once it is set as app.json.
+
+    Dictionary keys that are not strings are allowed, and values orjson
+    can't encode natively are serialized with str().
+
+    Attributes:
+        sort_keys (bool): Sort the keys of dictionaries.
+        compact (bool): Output without indentation.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS
+    sort_keys = False
+    compact = True
+
+    def _dumps(self, obj):
+        """Serialize obj to JSON bytes with the provider's options."""
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string.
+
+        Args:
+            obj (any): Data to serialize.
+
+        Returns:
+            str: JSON string.
+        """
+        return self._dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data as JSON.
+
+        Args:
+            s (str | bytes): Text or UTF-8 bytes.
+
+        Returns:
+            any: Deserialized data.
+        """
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Serialize the given arguments as JSON and return a Response
+        with the application/json mimetype.
+
+        Returns:
+            Response: Response containing the JSON data.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._dumps(obj), mimetype="application/json"
+        )
@@ -16,10 +16,256 @@ The following views are implemented on the app_views blueprint:
 Each view has its own routes and methods that can be found in
 their own files.
 """
-from flask import Blueprint
+from flask import Blueprint, Response, abort, make_response, request
+from flask import stream_with_context
+from functools import wraps
+import orjson
+import time
+
+from models import storage
 
 app_views = Blueprint("app_views", __name__, url_prefix="/api/v1")
 
+# Seconds a cached GET response stays valid, and the number of
+# responses kept before the cache is emptied.
+CACHE_TTL = 5
+CACHE_SIZE = 4096
+_cache = {}
+# Endpoints answering a POST without writing to the storage.
+_READ_ENDPOINTS = frozenset(("app_views.search_place",))
+
+# Number of objects encoded per chunk of a streamed JSON list.
+STREAM_CHUNK = 100
+
+
+def ojson(obj, status=200):
+    """Serialize obj with orjson into a JSON Response.
+
+    Used by the list endpoints to skip the jsonify machinery.
+
+    Args:
+        obj (any): Data to serialize.
+        status (int, optional): Status code. Defaults to 200.
+
+    Returns:
+        Response: Response containing the JSON data.
+    """
+    return Response(orjson.dumps(obj), status=status,
+                    mimetype="application/json")
+
+
+def load_json():
+    """Parse the JSON body of the current request with orjson.
+
+    Behaves like request.get_json(silent=True) without going through
+    Flask's JSON provider or caching the raw body.
+
+    Returns:
+        any: The deserialized body, or None if the request is not JSON
+            or its body is not valid JSON.
+    """
+    if not request.is_json:
+        return None
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def stream_json_list(items):
+    """Stream items as a JSON array, STREAM_CHUNK items at a time.
+
+    The array is never built in memory: each item is only encoded
+    with orjson when its chunk is sent.
+
+    Args:
+        items (iterable): Items to serialize, usually a generator
+            of to_dict() results.
+
+    Returns:
+        Response: Streamed response containing the JSON array.
+    """
+    def generate():
+        """Yield the encoded chunks of the array."""
+        yield b"["
+        separator = b""
+        batch = []
+        for item in items:
+            batch.append(orjson.dumps(item))
+            if len(batch) == STREAM_CHUNK:
+                yield separator + b",".join(batch)
+                separator = b","
+                batch = []
+        if batch:
+            yield separator + b",".join(batch)
+        yield b"]"
+
+    return Response(stream_with_context(generate()),
+                    mimetype="application/json")
+
+
+def _cache_stream(cache, key, expires, chunks):
+    """Pass the chunks of a streamed body through and cache the body
+    once the stream is complete.
+
+    Args:
+        cache (dict): Cache taken before the view ran. If it has been
+            dropped in the meantime, the body is stored in the
+            discarded cache only.
+        key (str): Request path.
+        expires (float): Expiry time of the entry.
+        chunks (iterable): Chunks of the body.
+    """
+    body = []
+    for chunk in chunks:
+        body.append(chunk)
+        yield chunk
+    cache[key] = (expires, b"".join(body))
+
+
+def cached(view):
+    """Cache the JSON body of a successful GET view by request path.
+
+    Cached bodies expire after CACHE_TTL seconds and are all dropped
+    as soon as a request modifies the storage. Streamed bodies are
+    cached once they have been sent completely.
+
+    Args:
+        view (function): View to cache.
+
+    Returns:
+        function: The wrapped view.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        """Serve the cached body or call the view and cache its body."""
+        # The cache is taken before the view runs, so that a body
+        # computed while a write drops the cache only goes to the
+        # dropped cache.
+        cache = _cache
+        now = time.monotonic()
+        hit = cache.get(request.path)
+        if hit and hit[0] > now:
+            return Response(hit[1], mimetype="application/json")
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            if len(cache) >= CACHE_SIZE:
+                cache.clear()
+            if response.is_streamed:
+                response.response = _cache_stream(
+                    cache, request.path, now + CACHE_TTL, response.response
+                )
+            else:
+                cache[request.path] = (now + CACHE_TTL, response.get_data())
+        return response
+
+    return wrapper
+
+
+def etagged(cls):
+    """Tag the response of a GET view listing the objects of a class.
+
+    The ETag is made of the number of objects of the class and their
+    last update, both read with one storage call. When the request's
+    If-None-Match holds it, 304 is returned and the view isn't called.
+
+    When the storage doesn't keep the microseconds of updated_at, as in
+    MySQL tables made before it was DATETIME(6), two writes within a
+    second would give the same ETag: the view is then left untagged.
+    The storage is checked once, when the view is decorated.
+
+    Args:
+        cls (class): Class of the listed objects.
+
+    Returns:
+        function: Decorator for the view.
+    """
+    def decorator(view):
+        """Wrap the view with the ETag check."""
+        if not storage.keeps_microseconds(cls):
+            return view
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            """Answer 304 for a matching ETag, otherwise call the view."""
+            count, last = storage.last_update(cls)
+            etag = "{}-{}".format(count, last.strftime("%Y%m%d%H%M%S%f")
+                                  if last else 0)
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def make_updater(cls, ignored_keys):
+    """Build the PUT view that updates an object of the given class.
+
+    The view takes the object ID from the URL and updates the object
+    with every key of the request body that is not in ignored_keys, in
+    a single storage.update() call.
+
+    Errors raised by the view:
+        - 404 (msg: "Not found") -> If the ID is not linked to any
+            object of the class.
+        - 400 (msg: "Not a JSON") -> If HTTP request body is
+            not valid JSON.
+
+    Args:
+        cls (class): Class of the objects to update.
+        ignored_keys (frozenset): Keys of the body that are not set.
+
+    Returns:
+        function: View returning a tuple of the dictionary of the updated
+            object and the status code.
+    """
+    def update(**ids):
+        """Updates an object with the data of the request body."""
+        obj = storage.get(cls, *ids.values())
+        if not obj:
+            abort(404)
+
+        data = load_json()
+        if not data:
+            abort(400, description="Not a JSON")
+
+        storage.update(obj, {key: value for key, value in data.items()
+                             if key not in ignored_keys})
+        return obj.to_dict(), 200
+
+    update.__name__ = "update_" + cls.__name__.lower()
+    update.__doc__ = "Updates a {} object.".format(cls.__name__)
+    return update
+
+
+@app_views.after_request
+def clear_cache(response):
+    """Drop every cached GET response after a write request.
+
+    POST /places_search only reads the storage and keeps the cache.
+
+    Args:
+        response (Response): Response of the request.
+
+    Returns:
+        Response: The unchanged response.
+    """
+    global _cache
+
+    if (request.method not in ("GET", "HEAD", "OPTIONS") and
+            request.endpoint not in _READ_ENDPOINTS):
+        _cache = {}
+    return response
+
+
 from api.v1.views.index import *
 from api.v1.views.states import *
 from api.v1.views.cities import *
@@ -6,22 +6,26 @@ Routes:
     - /amenities/<amenity_id> => methods[GET, DELETE, PUT]
 """
 
-from flask import abort, request, jsonify, make_response
+from flask import abort, jsonify
 
-from api.v1.views import app_views
+from api.v1.views import (
+    app_views, cached, load_json, make_updater, stream_json_list
+)
 from models import storage
 from models.amenity import Amenity
 
+_IGNORED_KEYS = frozenset(("id", "created_at", "updated_at", "__class__"))
+
 
 @app_views.route("/amenities", strict_slashes=False)
+@cached
 def get_amenities():
     """Retrieves the list of all Amenity objects.
 
     Returns:
         list: List of all the Amenity objects' dictionaries.
     """
-    amenities = storage.all(Amenity)
-    return jsonify([amenity.to_dict() for amenity in amenities.values()])
+    return stream_json_list(storage.iter_dicts(Amenity))
 
 
 @app_views.route("/amenities/<amenity_id>", strict_slashes=False)
@@ -66,9 +70,8 @@ def delete_amenity(amenity_id):
     amenity = storage.get(Amenity, amenity_id)
 
     if amenity:
-        storage.delete(amenity)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(amenity, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -90,53 +93,18 @@ def create_amenity():
             and the status code.
         Status code: 201 if successful, 400/404 if unsuccessful.
     """
-    data = request.get_json(silent=True)
+    data = load_json()
 
-    if data and data.get("name", None):
-        amenity = Amenity(**data)
-        amenity.save()
-        return make_response(jsonify(amenity.to_dict()), 201)
-    elif not data:
+    if not data:
         abort(400, description="Not a JSON")
-    elif data and not data.get("name", None):
+    if not data.get("name"):
         abort(400, description="Missing name")
 
+    amenity = Amenity(**data)
+    amenity.save()
+    return amenity.to_dict(), 201
 
-@app_views.route("/amenities/<amenity_id>", methods=["PUT"],
-                 strict_slashes=False)
-def update_amenity(amenity_id):
-    """Updates an Amenity Object.
-
-    Ignored keys:
-        - id
-        - created_at
-        - updated_at
-
-    Errors raised:
-        - 400 (msg: "Not a JSON") -> Raised if HTTP request
-            body is not valid JSON.
-        - 404 (msg: "Not found") -> Raised if amenity_id is not
-            linked to any Amenity object.
-
-    Args:
-        amenity_id (str): Amenity ID as from the URL.
 
-    Returns:
-        tuple: If no errors are raised a tuple of the dictionary
-            of the updated Amenity and the status code.
-        Status code: 200.
-    """
-    amenity = storage.get(Amenity, amenity_id)
-    data = request.get_json(silent=True)
-
-    ignored_keys = ["id", "created_at", "updated_at"]
-    if amenity and data:
-        for key, value in data.items():
-            if key not in ignored_keys:
-                setattr(amenity, key, value)
-                amenity.save()
-        return make_response(jsonify(amenity.to_dict()), 200)
-    elif not data:
-        abort(400, description="Not a JSON")
-    else:
-        abort(404)
+update_amenity = make_updater(Amenity, _IGNORED_KEYS)
+app_views.add_url_rule("/amenities/<amenity_id>", methods=["PUT"],
+                       view_func=update_amenity, strict_slashes=False)
@@ -6,15 +6,22 @@ Routes:
     - /cities/<city_id> => methods[GET, DELETE, PUT]
 """
 
-from flask import abort, request, jsonify, make_response
+from flask import abort, jsonify
 
-from api.v1.views import app_views
+from api.v1.views import (
+    app_views, cached, load_json, make_updater, stream_json_list
+)
 from models import storage
 from models.city import City
 from models.state import State
 
+_IGNORED_KEYS = frozenset(
+    ("created_at", "updated_at", "id", "state_id", "__class__")
+)
+
 
 @app_views.route("/states/<state_id>/cities", strict_slashes=False)
+@cached
 def get_cities(state_id):
     """Retrieve the list of City objects of a State.
 
@@ -32,7 +39,7 @@ def get_cities(state_id):
 
     if state:
         cities = state.cities
-        return jsonify([city.to_dict() for city in cities])
+        return stream_json_list(city.to_dict() for city in cities)
     else:
         abort(404)
 
@@ -77,9 +84,8 @@ def delete_city(city_id):
     city = storage.get(City, city_id)
 
     if city:
-        storage.delete(city)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(city, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -104,56 +110,21 @@ def add_city(state_id):
         tuple: Tuple of the dictionary of the newly created City
             and the status code.
     """
-    data = request.get_json(silent=True)
-    state = storage.get(State, state_id)
-
-    if data and data.get("name", None) and state:
-        data["state_id"] = state_id
-        city = City(**data)
-        city.save()
-        return make_response(jsonify(city.to_dict()), 201)
-    elif not state:
+    if not storage.get(State, state_id):
         abort(404)
-    elif data and not data.get("name", None):
-        abort(400, description="Missing name")
-    elif not data:
-        abort(400, description="Not a JSON")
-
 
-@app_views.route("/cities/<city_id>", methods=["PUT"], strict_slashes=False)
-def update_city(city_id):
-    """Updates a City object.
-
-    Args:
-        city_id (str): City ID.
+    data = load_json()
+    if not data:
+        abort(400, description="Not a JSON")
+    if not data.get("name"):
+        abort(400, description="Missing name")
 
-    Ignored keys:
-        - id
-        - state_id
-        - created_at
-        - updated_at
+    data["state_id"] = state_id
+    city = City(**data)
+    city.save()
+    return city.to_dict(), 201
 
-    Errors raised:
-        - 404 (msg: "Not found") -> If the city_id is not
-            linked to any City object.
-        - 400 (msg: "Not a JSON") -> If HTTP request body is
-            not valid JSON.
 
-    Returns:
-        tuple: Tuple of the dictionary of the updated City
-            and the status code.
-    """
-    city = storage.get(City, city_id)
-    data = request.get_json(silent=True)
-
-    ignored_keys = ["created_at", "updated_at", "id", "state_id"]
-    if city and data:
-        for key, value in data.items():
-            if key not in ignored_keys:
-                setattr(city, key, value)
-                city.save()
-        return make_response(jsonify(city.to_dict()), 200)
-    elif not city:
-        abort(404)
-    elif not data:
-        abort(400, description="Not a JSON")
+update_city = make_updater(City, _IGNORED_KEYS)
+app_views.add_url_rule("/cities/<city_id>", methods=["PUT"],
+                       view_func=update_city, strict_slashes=False)
@@ -7,8 +7,8 @@ Routes:
 
 """
 
-from api.v1.views import app_views
-from flask import jsonify
+from api.v1.views import app_views, cached
+from flask import Response, jsonify
 
 from models import storage
 from models.amenity import Amenity
@@ -18,14 +18,17 @@ from models.review import Review
 from models.state import State
 from models.user import User
 
-classes = {
-    "amenity": Amenity,
-    "city": City,
-    "place": Place,
-    "review": Review,
-    "state": State,
-    "user": User,
-}
+# Keys of the /stats response and the class counted for each of them.
+_STATS_PAIRS = (
+    ("amenities", Amenity),
+    ("cities", City),
+    ("places", Place),
+    ("reviews", Review),
+    ("states", State),
+    ("users", User),
+)
+
+_STATUS_OK = b'{"status":"OK"}'
 
 
 @app_views.route("/status")
@@ -35,10 +38,11 @@ def get_status():
     Returns:
         Response: Response containing the status.
     """
-    return {"status": "OK"}
+    return Response(_STATUS_OK, mimetype="application/json")
 
 
 @app_views.route("/stats")
+@cached
 def get_stats():
     """Retrieves the number of each objects by type.
 
@@ -46,15 +50,6 @@ def get_stats():
         Response: Response containing the number of objects
             of each type.
     """
-    stats = [storage.count(cls) for cls in classes.values()]
-
-    return jsonify(
-        {
-            "amenities": stats[0],
-            "cities": stats[1],
-            "places": stats[2],
-            "reviews": stats[3],
-            "states": stats[4],
-            "users": stats[5],
-        }
-    )
+    counts = storage.counts()
+
+    return jsonify({key: counts[cls.__name__] for key, cls in _STATS_PAIRS})
@@ -7,16 +7,25 @@ Routes:
     - /search_places => methods[POST]
 """
 
-from flask import abort, request, jsonify, make_response
+from flask import abort, jsonify
 
-from api.v1.views import app_views
-from models import storage
+from api.v1.views import (
+    app_views, cached, load_json, make_updater, stream_json_list
+)
+from models import storage, storage_t
+from models.amenity import Amenity
 from models.city import City
 from models.place import Place
+from models.state import State
 from models.user import User
 
+_IGNORED_KEYS = frozenset(
+    ("id", "city_id", "user_id", "created_at", "updated_at", "__class__")
+)
+
 
 @app_views.route("/cities/<city_id>/places", strict_slashes=False)
+@cached
 def get_places(city_id):
     """Retrieve the list of Place objects of a City.
 
@@ -34,7 +43,7 @@ def get_places(city_id):
 
     if city:
         places = city.places
-        return jsonify([place.to_dict() for place in places])
+        return stream_json_list(place.to_dict() for place in places)
     else:
         abort(404)
 
@@ -79,9 +88,8 @@ def delete_place(place_id):
     place = storage.get(Place, place_id)
 
     if place:
-        storage.delete(place)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(place, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -110,63 +118,44 @@ def create_place(city_id):
         tuple: Tuple of the dictionary of the newly created Place
             and the status code.
     """
-    city = storage.get(City, city_id)
-    data = request.get_json(silent=True)
-    user = data and storage.get(User, data.get("user_id"))
-
-    if city and user and data and data.get("name"):
-        data["city_id"] = city_id
-        place = Place(**data)
-        place.save()
-        return make_response(jsonify(place.to_dict()), 201)
-    elif data and not data.get("name"):
-        abort(400, description="Missing name")
-    elif data and not data.get("user_id"):
-        abort(400, description="Missing user_id")
-    elif not data:
+    if not storage.get(City, city_id):
+        abort(404)
+
+    data = load_json()
+    if not data:
         abort(400, description="Not a JSON")
-    elif not city or not user:
+
+    user_id = data.get("user_id")
+    if not user_id:
+        abort(400, description="Missing user_id")
+    if not storage.get(User, user_id):
         abort(404)
+    if not data.get("name"):
+        abort(400, description="Missing name")
 
+    data["city_id"] = city_id
+    place = Place(**data)
+    place.save()
+    return place.to_dict(), 201
 
-@app_views.route("/places/<place_id>", methods=["PUT"], strict_slashes=False)
-def update_place(place_id):
-    """Updates a Place object.
 
-    Args:
-        place_id (str): Place ID.
+update_place = make_updater(Place, _IGNORED_KEYS)
+app_views.add_url_rule("/places/<place_id>", methods=["PUT"],
+                       view_func=update_place, strict_slashes=False)
 
-    Ignored keys:
-        - id
-        - user_id
-        - city_id
-        - created_at
-        - updated_at
 
-    Errors raised:
-        - 404 (msg: "Not found") -> If the place_id is not
-            linked to any Place object.
-        - 400 (msg: "Not a JSON") -> If HTTP request body is
-            not valid JSON.
+def _amenity_ids(place):
+    """Return the ids of the amenities linked to a Place.
+
+    Args:
+        place (Place): Place object.
 
     Returns:
-        tuple: Tuple of the dictionary of the updated Place
-            and the status code.
+        iterable: Amenity ids of the place.
     """
-    place = storage.get(Place, place_id)
-    data = request.get_json(silent=True)
-    ignored_keys = ["id", "city_id", "user_id", "created_at", "updated_at"]
-
-    if place and data:
-        for key, value in data.items():
-            if key not in ignored_keys:
-                setattr(place, key, value)
-                place.save()
-        return make_response(jsonify(place.to_dict()), 200)
-    elif not data:
-        abort(400, description="Not a JSON")
-    elif not place:
-        abort(404)
+    if storage_t == "db":
+        return (amenity.id for amenity in place.amenities)
+    return place.amenity_ids
 
 
 @app_views.route("/places_search", methods=["POST"])
@@ -201,51 +190,60 @@ def search_place():
     Returns:
         list : Place objects as per the search request.
     """
-    from models.state import State
-
-    data = request.get_json(silent=True)
-
-    places = []
+    data = load_json()
 
     if data is None:
         abort(400, description="Not a JSON")
 
-    if not data or (
-            data and not data.get("states") and not data.get("cities")):
-        places.extend(storage.all(Place).values())
-
-    if data and data.get("states"):
-        state_ids = data.get("states")
-
-        if len(state_ids):
-            for state_id in state_ids:
-                state = storage.get(State, state_id)
-                if state:
-                    for city in state.cities:
-                        places.extend(city.places)
-
-    if data and data.get("cities"):
-        city_ids = data.get("cities")
-
-        if len(city_ids):
-            for city_id in city_ids:
-                city = storage.get(City, city_id)
-                if city and city.state_id not in state_ids:
-                    places.extend(city.places)
-
-    if data and data.get("amenities"):
-        amenity_ids = data.get("amenities")
-
-        if len(amenity_ids):
-            valid_places = []
-            for place in places:
-                for amenity_id in amenity_ids:
-                    if amenity_id not in place.amenity_ids:
-                        valid = False
-                        break
-                    valid = True
-                if valid:
-                    valid_places.append(place)
-            places = valid_places
-
-    return jsonify([place.to_dict() for place in places])
+    # An empty body of any JSON type, such as [] or {}, searches all
+    # the places.
+    data = data or {}
+    if not isinstance(data, dict):
+        abort(400, description="Not a JSON")
+
+    state_ids = data.get("states") or []
+    city_ids = data.get("cities") or []
+    amenity_ids = data.get("amenities") or []
+
+    # The cities, places and, to filter them, the amenities of the
+    # places are loaded along with the states, cities and places instead
+    # of once per object under DBStorage.
+    load = ("amenities",) if amenity_ids else ()
+
+    # Keyed by id so a Place reached through both a State and one of
+    # its Cities is only kept once.
+    places = {}
+
+    if not state_ids and not city_ids:
+        places = {place.id: place for place in storage.iter(Place, load)}
+
+    cities = [
+        city
+        for state in storage.get_many(State, state_ids,
+                                      ("cities", "places") + load)
+        for city in state.cities
+    ]
+    cities.extend(
+        city
+        for city in storage.get_many(City, city_ids, ("places",) + load)
+        if city.state_id not in state_ids
+    )
+
+    for city in cities:
+        for place in city.places:
+            places[place.id] = place
+
+    places = list(places.values())
+
+    if amenity_ids:
+        wanted = frozenset(amenity_ids)
+        if len(storage.get_many(Amenity, list(wanted))) < len(wanted):
+            # An unknown Amenity id can't be linked to any Place.
+            places = []
+        else:
+            places = [
+                place for place in places
+                if wanted.issubset(_amenity_ids(place))
+            ]
+
+    return stream_json_list(place.to_dict() for place in places)
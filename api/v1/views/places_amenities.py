@@ -6,9 +6,9 @@ Routes:
     - /places/place_id>/amenities/<amenity_id> => methods[DELETE, POST]
 """
 
-from flask import abort, jsonify, make_response
+from flask import abort
 
-from api.v1.views import app_views
+from api.v1.views import app_views, ojson
 from models import storage, storage_t
 from models.amenity import Amenity
 from models.place import Place
@@ -28,7 +28,7 @@ def get_amenities_for_place(place_id):
 
     if place:
         amenities = place.amenities
-        return jsonify([amenity.to_dict() for amenity in amenities])
+        return ojson([amenity.to_dict() for amenity in amenities])
     else:
         abort(404)
 
@@ -59,7 +59,7 @@ def delete_amenity_from_place(place_id, amenity_id):
             abort(404)
 
         place.save()
-        return make_response(jsonify({}), 200)
+        return {}, 200
     elif not place or not amenity:
         abort(404)
 
@@ -88,8 +88,8 @@ def add_amenity_to_place(place_id, amenity_id):
         else:
             place.amenities = amenity
         place.save()
-        return make_response(jsonify(amenity.to_dict()), 201)
+        return amenity.to_dict(), 201
     elif not place or not amenity:
         abort(404)
     elif amenity and amenity in place.amenities:
-        return make_response(jsonify(amenity.to_dict()), 200)
+        return amenity.to_dict(), 200
@@ -6,14 +6,18 @@ Routes:
     - /reviews/<review_id> => methods[GET, DELETE, PUT]
 """
 
-from flask import abort, request, jsonify, make_response
+from flask import abort, jsonify
 
-from api.v1.views import app_views
+from api.v1.views import app_views, load_json, make_updater, ojson
 from models import storage
 from models.place import Place
 from models.review import Review
 from models.user import User
 
+_IGNORED_KEYS = frozenset(
+    ("id", "created_at", "updated_at", "user_id", "place_id", "__class__")
+)
+
 
 @app_views.route("/places/<place_id>/reviews", strict_slashes=False)
 def get_reviews(place_id):
@@ -34,7 +38,7 @@ def get_reviews(place_id):
 
     if place:
         reviews = place.reviews
-        return jsonify([review.to_dict() for review in reviews])
+        return ojson([review.to_dict() for review in reviews])
     else:
         abort(404)
 
@@ -79,9 +83,8 @@ def delete_review(review_id):
     review = storage.get(Review, review_id)
 
     if review:
-        storage.delete(review)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(review, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -110,60 +113,27 @@ def create_review(place_id):
         tuple: Tuple of the dictionary of the newly created Review
             and the status code.
     """
-    place = storage.get(Place, place_id)
-    data = request.get_json(silent=True)
-    user = data and storage.get(User, data.get("user_id"))
-
-    if place and user and data and data.get("text"):
-        data["place_id"] = place_id
-        review = Review(**data)
-        review.save()
-        return make_response(jsonify(review.to_dict()), 201)
-    elif data and not data.get("text"):
-        abort(400, description="Missing text")
-    elif data and not data.get("user_id"):
-        abort(400, description="Missing user_id")
-    elif not data:
-        abort(400, description="Not a JSON")
-    elif not place or not user:
+    if not storage.get(Place, place_id):
         abort(404)
 
+    data = load_json()
+    if not data:
+        abort(400, description="Not a JSON")
 
-@app_views.route("/reviews/<review_id>", methods=["PUT"], strict_slashes=False)
-def update_review(review_id):
-    """Updates a Review object.
+    user_id = data.get("user_id")
+    if not user_id:
+        abort(400, description="Missing user_id")
+    if not storage.get(User, user_id):
+        abort(404)
+    if not data.get("text"):
+        abort(400, description="Missing text")
 
-    Args:
-        review_id (str): Review ID.
+    data["place_id"] = place_id
+    review = Review(**data)
+    review.save()
+    return review.to_dict(), 201
 
-    Ignored keys:
-        - id
-        - place_id
-        - user_id
-        - created_at
-        - updated_at
 
-    Errors raised:
-        - 404 (msg: "Not found") -> If the review_id is not
-            linked to any Review object.
-        - 400 (msg: "Not a JSON") -> If HTTP request body is
-            not valid JSON.
-
-    Returns:
-        tuple: Tuple of the dictionary of the updated Review
-            and the status code.
-    """
-    review = storage.get(Review, review_id)
-    data = request.get_json(silent=True)
-
-    ignored_keys = ["id", "created_at", "updated_at", "user_id", "place_id"]
-    if review and data:
-        for key, value in data.items():
-            if key not in ignored_keys:
-                setattr(review, key, value)
-                review.save()
-        return make_response(jsonify(review.to_dict()), 200)
-    elif not data:
-        abort(400, description="Not a JSON")
-    elif not review:
-        abort(404)
+update_review = make_updater(Review, _IGNORED_KEYS)
+app_views.add_url_rule("/reviews/<review_id>", methods=["PUT"],
+                       view_func=update_review, strict_slashes=False)
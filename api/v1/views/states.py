@@ -6,22 +6,24 @@ Routes:
     - /states/<state_id> => methods=[GET, PUT, DELETE]
 """
 
-from flask import abort, request, jsonify, make_response
+from flask import abort, jsonify
 
-from api.v1.views import app_views
+from api.v1.views import app_views, etagged, load_json, stream_json_list
 from models import storage
 from models.state import State
 
+_IGNORED_KEYS = frozenset(("id", "created_at", "updated_at", "__class__"))
+
 
 @app_views.route("/states", strict_slashes=False)
+@etagged(State)
 def get_states():
     """Retrieves the list of all State objects.
 
     Returns:
         list: List of all State objects dictionaries.
     """
-    states = storage.all(State)
-    return jsonify([state.to_dict() for state in states.values()])
+    return stream_json_list(storage.iter_dicts(State))
 
 
 @app_views.route("/states/<state_id>", strict_slashes=False)
@@ -66,9 +68,8 @@ def delete_state(state_id):
     state = storage.get(State, state_id)
 
     if state:
-        storage.delete(state)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(state, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -90,11 +91,11 @@ def create_state():
             the status code.
         Status code: 201 if successful, 400/404 if unsuccessful.
     """
-    data = request.get_json(silent=True)
+    data = load_json()
     if data and data.get("name", None):
         new_state = State(**data)
         new_state.save()
-        return make_response(jsonify(new_state.to_dict()), 201)
+        return new_state.to_dict(), 201
     elif data and not data.get("name", None):
         abort(400, description="Missing name")
     else:
@@ -125,15 +126,12 @@ def update_state(state_id):
         Status code: 200.
     """
     state = storage.get(State, state_id)
-    data = request.get_json(silent=True)
+    data = load_json()
 
-    ignored_keys = ["id", "created_at", "updated_at"]
     if state and data:
-        for key, value in data.items():
-            if key not in ignored_keys:
-                setattr(state, key, value)
-        state.save()
-        return make_response(jsonify(state.to_dict()), 200)
+        storage.update(state, {key: value for key, value in data.items()
+                               if key not in _IGNORED_KEYS})
+        return state.to_dict(), 200
     elif not state:
         abort(404)
     elif not data:
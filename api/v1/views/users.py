@@ -6,23 +6,27 @@ Routes:
     - /users/<user_id> => methods[GET, DELETE, PUT]
 """
 
-from flask import abort, request, jsonify, make_response
-import hashlib
+from flask import abort, jsonify
 
-from api.v1.views import app_views
+from api.v1.views import app_views, etagged, load_json, stream_json_list
 from models import storage
+from models.base_model import hash_password
 from models.user import User
 
+_IGNORED_KEYS = frozenset(
+    ("id", "created_at", "updated_at", "email", "__class__")
+)
+
 
 @app_views.route("/users", strict_slashes=False)
+@etagged(User)
 def get_users():
     """Retrieves the list of all User objects.
 
     Returns:
         list: List of all the User objects' dictionaries.
     """
-    users = storage.all(User)
-    return jsonify([user.to_dict() for user in users.values()])
+    return stream_json_list(storage.iter_dicts(User))
 
 
 @app_views.route("/users/<user_id>", strict_slashes=False)
@@ -66,9 +70,8 @@ def delete_user(user_id):
     user = storage.get(User, user_id)
 
     if user:
-        storage.delete(user)
-        storage.save()
-        return make_response(jsonify({}), 200)
+        storage.delete(user, commit=True)
+        return {}, 200
     else:
         abort(404)
 
@@ -92,12 +95,12 @@ def create_user():
             and the status code.
         Status code: 201 if successful, 400/404 if unsuccessful.
     """
-    data = request.get_json(silent=True)
+    data = load_json()
 
     if data and data.get("email") and data.get("password"):
         user = User(**data)
         user.save()
-        return make_response(jsonify(user.to_dict()), 201)
+        return user.to_dict(), 201
     elif data and not data.get("email"):
         abort(400, description="Missing email")
     elif data and not data.get("password"):
@@ -130,19 +133,16 @@ def update_user(user_id):
             of the updated User and the status code.
         Status code: 200.
     """
-    data = request.get_json(silent=True)
+    data = load_json()
     user = storage.get(User, user_id)
 
-    ignore_keys = ["id", "created_at", "updated_at", "email"]
     if user and data:
-        for key, value in data.items():
-            if key == "password":
-                value = value.encode("ascii")
-                setattr(user, key, hashlib.md5(value).hexdigest())
-            elif key not in ignore_keys:
-                setattr(user, key, value)
-        user.save()
-        return make_response(jsonify(user.to_dict()), 200)
+        values = {key: value for key, value in data.items()
+                  if key not in _IGNORED_KEYS}
+        if "password" in values:
+            values["password"] = hash_password(values["password"])
+        storage.update(user, values)
+        return user.to_dict(), 200
     elif not user:
         abort(404)
     elif not data:
@@ -6,12 +6,68 @@ Contains class BaseModel
 from datetime import datetime
 import hashlib
 import models
+import os
+import re
 from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
+import weakref
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
 
+# to_dict() results by instance. Kept outside of the instances so that
+# the cache never shows up in __dict__, and dropped on every setattr.
+dict_cache = weakref.WeakKeyDictionary()
+
+# to_dict() builders by class, made on the first to_dict() call.
+dict_builders = {}
+
+# PBKDF2 iterations used to hash the passwords of users.
+PASSWORD_ITERATIONS = 100000
+
+
+def hash_password(password):
+    """Hash a password with PBKDF2-SHA256 and a random salt.
+
+    hashlib releases the GIL while hashing, so other requests keep
+    being served while a password is hashed.
+
+    Args:
+        password (str): Password in clear text.
+
+    Returns:
+        str: "pbkdf2_sha256$<iterations>$<salt>$<hash>", salt and hash
+            in hex.
+    """
+    salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt,
+                                 PASSWORD_ITERATIONS)
+    return "pbkdf2_sha256${}${}${}".format(PASSWORD_ITERATIONS, salt.hex(),
+                                           digest.hex())
+
+
+# Format of the strings returned by hash_password().
+PASSWORD_HASH = re.compile(r"pbkdf2_sha256\$\d+\$[0-9a-f]{32}\$[0-9a-f]{64}")
+
+
+def is_password_hash(value):
+    """Tell whether a value is a password hashed by hash_password().
+
+    Args:
+        value (any): Password, hashed or in clear text.
+
+    Returns:
+        bool: True if value has the format of hash_password() results.
+    """
+    return isinstance(value, str) and bool(PASSWORD_HASH.fullmatch(value))
+
+
+# MySQL's DATETIME drops the microseconds unless a precision is given.
+# They are kept so that two updates within the same second still give
+# different updated_at values.
+DateTime6 = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
 if models.storage_t == "db":
     Base = declarative_base()
 else:
@@ -22,16 +78,15 @@ class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
-        created_at = Column(DateTime, default=datetime.utcnow)
-        updated_at = Column(DateTime, default=datetime.utcnow)
+        created_at = Column(DateTime6, default=datetime.utcnow)
+        updated_at = Column(DateTime6, default=datetime.utcnow)
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
         if kwargs:
             for key, value in kwargs.items():
-                if key == "password" and not kwargs.get("created_at"):
-                    value = value.encode("ascii")
-                    setattr(self, key, hashlib.md5(value).hexdigest())
+                if key == "password" and not is_password_hash(value):
+                    setattr(self, key, hash_password(value))
                 elif key != "__class__":
                     setattr(self, key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
@@ -49,6 +104,11 @@ class BaseModel:
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
 
+    def __setattr__(self, name, value):
+        """Set an attribute and invalidate the cached dictionary"""
+        dict_cache.pop(self, None)
+        super().__setattr__(name, value)
+
     def __str__(self):
         """String representation of the BaseModel class"""
         return "[{:s}] ({:s}) {}".format(self.__class__.__name__, self.id,
@@ -60,6 +120,49 @@ class BaseModel:
         models.storage.new(self)
         models.storage.save()
 
+    @classmethod
+    def _dict_builder(cls):
+        """Return the function building the to_dict() of cls instances.
+
+        The function is made once per class with everything that only
+        depends on the class resolved up front: the class name, whether
+        a password must be stripped, and the attributes to read. Mapped
+        classes serialize their columns only, so relationships loaded in
+        __dict__ and SQLAlchemy's internal state are skipped without a
+        lookup. Other classes copy __dict__, as instances may carry any
+        attribute.
+        """
+        try:
+            return dict_builders[cls]
+        except KeyError:
+            pass
+
+        name = cls.__name__
+        strip_password = name == "User"
+        table = getattr(cls, "__table__", None)
+        keys = None
+        if table is not None:
+            keys = tuple(column.key for column in table.columns)
+
+        def build(values, password):
+            """Build the dictionary of an instance from its __dict__."""
+            if keys is None:
+                new_dict = values.copy()
+                new_dict.pop("_sa_instance_state", None)
+            else:
+                new_dict = {key: values[key] for key in keys if key in values}
+            if "created_at" in new_dict:
+                new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            if "updated_at" in new_dict:
+                new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["__class__"] = name
+            if strip_password and not password and new_dict.get("password"):
+                del new_dict["password"]
+            return new_dict
+
+        dict_builders[cls] = build
+        return build
+
     def to_dict(self, password=False):
         """returns a dictionary containing all keys/values of the instance
 
@@ -69,20 +172,21 @@ class BaseModel:
                 password in the User's dictionary.
                 When True the password of User is included in the dictionary.
                 It's set to True when saving the data.
+
+        The dictionary without the password is cached until the next
+        attribute assignment, so repeated reads of an unchanged instance
+        only pay for a shallow copy.
         """
-        new_dict = self.__dict__.copy()
-        if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
-        if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
-        new_dict["__class__"] = self.__class__.__name__
-        if "_sa_instance_state" in new_dict:
-            del new_dict["_sa_instance_state"]
-
-        if (not password and new_dict["__class__"] == "User" and
-                new_dict.get("password")):
-            del new_dict["password"]
+        if not password:
+            cached = dict_cache.get(self)
+            if cached is not None:
+                return dict(cached)
+
+        new_dict = self._dict_builder()(self.__dict__, password)
 
+        if not password:
+            dict_cache[self] = new_dict
+            return dict(new_dict)
         return new_dict
 
     def delete(self):
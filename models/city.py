@@ -40,11 +40,5 @@ class City(BaseModel, Base):
             """Get all places in the City"""
 
             from models import storage
-            from models.place import Place
-
-            places = storage.all(Place)
-            return [
-                place
-                for place in places.values()
-                if place.city_id == self.id
-            ]
+
+            return storage.city_places(self.id)
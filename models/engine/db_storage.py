@@ -3,16 +3,18 @@
 Contains the class DBStorage
 """
 
+from datetime import datetime
 from models.amenity import Amenity
-from models.base_model import Base
+from models.base_model import Base, dict_cache, time
 from models.city import City
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
 from os import getenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import create_engine, func, inspect, literal, select
+from sqlalchemy import union_all
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker
 
 classes = {
     "Amenity": Amenity,
@@ -56,6 +58,58 @@ class DBStorage:
                     new_dict[key] = obj
         return new_dict
 
+    def iter(self, cls=None, load=()):
+        """iterate over the objects of the current database session
+
+        Rows are fetched in batches of 500 instead of all at once, and
+        no dict is built around them.
+
+        Args:
+            cls (class, optional): Class. Defaults to None.
+            load (tuple, optional): Chain of relationship names to load
+                with the objects of cls, as for get_many(). Defaults
+                to ().
+
+        Yields:
+            obj : objects in storage matching the given class, or all the
+                objects if no class is passed.
+        """
+        for clss in classes:
+            if cls is None or cls is classes[clss] or cls is clss:
+                query = self.__session.query(classes[clss])
+                if load:
+                    query = query.options(
+                        self.__load_option(classes[clss], load)
+                    )
+                yield from query.yield_per(500)
+
+    def iter_dicts(self, cls):
+        """iterate over the dictionaries of the objects of a class
+
+        Only the columns are queried, so no object is built for the
+        rows. The dictionaries match the ones of to_dict(), without the
+        password of users.
+
+        Args:
+            cls (class): Class.
+
+        Yields:
+            dict : dictionary of each object of the class.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        name = cls.__name__
+        keys = tuple(column.key for column in cls.__table__.columns
+                     if not (name == "User" and column.key == "password"))
+        columns = [getattr(cls, key) for key in keys]
+        for row in self.__session.query(*columns).yield_per(500):
+            obj_dict = dict(zip(keys, row))
+            for key in ("created_at", "updated_at"):
+                if obj_dict.get(key) is not None:
+                    obj_dict[key] = obj_dict[key].strftime(time)
+            obj_dict["__class__"] = name
+            yield obj_dict
+
     def new(self, obj):
         """add the object to the current database session"""
         self.__session.add(obj)
@@ -64,10 +118,39 @@ class DBStorage:
         """commit all changes of the current database session"""
         self.__session.commit()
 
-    def delete(self, obj=None):
-        """delete from the current database session obj if not None"""
+    def delete(self, obj=None, commit=False):
+        """delete from the current database session obj if not None
+
+        Args:
+            obj (obj, optional): Object to delete. Defaults to None.
+            commit (bool, optional): Commit the deletion right away, in
+                the same transaction. Defaults to False.
+        """
         if obj is not None:
             self.__session.delete(obj)
+            if commit:
+                self.__session.commit()
+
+    def update(self, obj, values):
+        """update the columns of obj with a single UPDATE and commit
+
+        Keys that aren't columns of the object's table are skipped.
+        updated_at is set to the current datetime.
+
+        Args:
+            obj (obj): Object to update.
+            values (dict): New values by attribute name.
+        """
+        cls = type(obj)
+        keys = {column.key for column in cls.__table__.columns}
+        values = {key: value for key, value in values.items() if key in keys}
+        values["updated_at"] = datetime.utcnow()
+        # "evaluate" applies the values to obj in the session too.
+        self.__session.query(cls).filter_by(id=obj.id).update(
+            values, synchronize_session="evaluate"
+        )
+        dict_cache.pop(obj, None)
+        self.__session.commit()
 
     def reload(self):
         """reloads data from the database"""
@@ -91,13 +174,61 @@ class DBStorage:
             obj : Object based on cls and id,
                 or None if not found.
         """
-        retrieved_obj = None
-        new_dict = self.all(cls)
-        for obj in new_dict.values():
-            if obj.id == id:
-                retrieved_obj = obj
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if id is None or cls not in classes.values():
+            return None
+        # Primary key lookup: served from the identity map when the
+        # object is already loaded, otherwise a single row SELECT.
+        return self.__session.get(cls, id)
 
-        return retrieved_obj
+    def get_many(self, cls, ids, load=()):
+        """Retrieve several objects of the same class in one query.
+
+        Args:
+            cls (class): Class of the objects.
+            ids (list) : Object IDs.
+            load (tuple, optional): Chain of relationship names to load
+                with the objects, each one on the class of the previous
+                one, e.g. ("cities", "places") for State. Every level is
+                loaded with one SELECT ... IN query instead of one query
+                per object. Defaults to ().
+
+        Returns:
+            list : Objects based on cls and ids. IDs not linked to any
+                object are skipped.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        if not ids:
+            return []
+        query = self.__session.query(cls).filter(cls.id.in_(ids))
+        if load:
+            query = query.options(self.__load_option(cls, load))
+        return query.all()
+
+    def __load_option(self, cls, load):
+        """Build the option loading a chain of relationships.
+
+        Args:
+            cls (class): Class of the queried objects.
+            load (tuple): Chain of relationship names, each one on the
+                class of the previous one.
+
+        Returns:
+            obj : Option loading every level with one SELECT ... IN
+                query.
+        """
+        option = None
+        owner = cls
+        for name in load:
+            attr = getattr(owner, name)
+            if option is None:
+                option = selectinload(attr)
+            else:
+                option = option.selectinload(attr)
+            owner = attr.property.mapper.class_
+        return option
 
     def count(self, cls=None):
         """count the number of object in storage
@@ -110,9 +241,61 @@ class DBStorage:
                 If no class is passed, returns the count of all objects in
                 storage.
         """
-        if cls:
-            count = len(self.all(cls).values())
-        else:
-            count = len(self.all().values())
+        if not cls:
+            return sum(self.counts().values())
+        if isinstance(cls, str):
+            cls = classes.get(cls)
+        if cls not in classes.values():
+            return 0
+
+        return self.__session.query(func.count(cls.id)).scalar()
+
+    def last_update(self, cls):
+        """count the objects of a class and find their last update
+
+        Both values come from a single aggregate query.
+
+        Args:
+            cls (class): Class.
+
+        Returns:
+            tuple : number of objects of the class and the most recent
+                updated_at among them, None if there is no object.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        query = self.__session.query(func.count(cls.id),
+                                     func.max(cls.updated_at))
+        return tuple(query.one())
+
+    def keeps_microseconds(self, cls):
+        """tell whether the updated_at column of a class keeps microseconds
+
+        The column type is read from the database, as create_all()
+        doesn't alter tables made before updated_at was DATETIME(6).
+
+        Args:
+            cls (class): Class.
+
+        Returns:
+            bool : True if updated_at is stored with microseconds.
+        """
+        if isinstance(cls, str):
+            cls = classes[cls]
+        for column in inspect(self.__engine).get_columns(cls.__tablename__):
+            if column["name"] == "updated_at":
+                return bool(getattr(column["type"], "fsp", None))
+        return False
+
+    def counts(self):
+        """count the number of objects of every class in one query
+
+        Returns:
+            dict : number of objects in storage keyed by class name.
+        """
+        query = union_all(*(
+            select(literal(name), func.count()).select_from(cls)
+            for name, cls in classes.items()
+        ))
 
-        return count
+        return dict(self.__session.execute(query).all())
@@ -3,6 +3,7 @@
 Contains the FileStorage class
 """
 
+import hashlib
 import json
 from models.amenity import Amenity
 from models.base_model import BaseModel
@@ -30,6 +31,13 @@ class FileStorage:
     __file_path = "file.json"
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # dictionary - Place objects by city_id, then by id
+    __places = {}
+    # bytes - digest of the JSON file content when it was last reloaded
+    __file_digest = None
+    # bool - objects changed through new(), update() or delete() since
+    # the last save or reload
+    __dirty = False
 
     def all(self, cls=None):
         """returns the dictionary __objects"""
@@ -41,11 +49,46 @@ class FileStorage:
             return new_dict
         return self.__objects
 
+    def iter(self, cls=None, load=()):
+        """iterate over the objects of __objects without building a dict
+
+        Args:
+            cls (class, optional): Class. Defaults to None.
+            load (tuple, optional): Relationships to load with the
+                objects. Unused, the related objects are already in
+                memory. Defaults to ().
+
+        Yields:
+            obj : objects in storage matching the given class, or all the
+                objects if no class is passed.
+        """
+        # Iterate over a snapshot so that objects added or deleted while
+        # a response is streamed don't break the iteration.
+        for obj in list(self.__objects.values()):
+            if (cls is None or cls == obj.__class__ or
+                    cls == obj.__class__.__name__):
+                yield obj
+
+    def iter_dicts(self, cls):
+        """iterate over the dictionaries of the objects of a class
+
+        Args:
+            cls (class): Class.
+
+        Yields:
+            dict : to_dict() of each object of the class.
+        """
+        for obj in self.iter(cls):
+            yield obj.to_dict()
+
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
             self.__objects[key] = obj
+            FileStorage.__dirty = True
+            if isinstance(obj, Place):
+                self.__places.setdefault(obj.city_id, {})[obj.id] = obj
 
     def save(self):
         """serializes __objects to the JSON file (path: __file_path)"""
@@ -54,23 +97,84 @@ class FileStorage:
             json_objects[key] = self.__objects[key].to_dict(password=True)
         with open(self.__file_path, "w") as f:
             json.dump(json_objects, f, indent=4)
+        FileStorage.__dirty = False
+
+    def update(self, obj, values):
+        """set the values on obj and save it
+
+        Args:
+            obj (obj): Object to update.
+            values (dict): New values by attribute name.
+        """
+        # Flagged first, so that reload() drops the values already set
+        # if setting one of them fails.
+        FileStorage.__dirty = True
+        for key, value in values.items():
+            setattr(obj, key, value)
+        obj.save()
 
     def reload(self):
-        """deserializes the JSON file to __objects"""
+        """deserializes the JSON file to __objects
+
+        The objects are only rebuilt when the content of the file changed
+        since the last reload, which a digest of the file tells without
+        parsing it, or when new(), update() or delete() changed the
+        objects without a save since. Otherwise the objects, and the
+        to_dict() results cached on them, are kept as they are: an
+        attribute set directly on an object and never saved is not
+        undone.
+        """
         try:
-            with open(self.__file_path, "r") as f:
-                jo = json.load(f)
+            with open(self.__file_path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha1(content).digest()
+            if digest == FileStorage.__file_digest and not FileStorage.__dirty:
+                return
+            jo = json.loads(content)
             for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+                self.new(classes[jo[key]["__class__"]](**jo[key]))
+            FileStorage.__file_digest = digest
+            FileStorage.__dirty = False
         except FileNotFoundError:
-            pass
+            FileStorage.__file_digest = None
+
+    def delete(self, obj=None, commit=False):
+        """delete obj from __objects if it’s inside
 
-    def delete(self, obj=None):
-        """delete obj from __objects if it’s inside"""
+        Args:
+            obj (obj, optional): Object to delete. Defaults to None.
+            commit (bool, optional): Save __objects to the JSON file
+                right away. Defaults to False.
+        """
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
             if key in self.__objects:
                 del self.__objects[key]
+                FileStorage.__dirty = True
+            if isinstance(obj, Place):
+                self.__places.get(obj.city_id, {}).pop(obj.id, None)
+            if commit:
+                self.save()
+
+    def city_places(self, city_id):
+        """Retrieve the places of a city from the city index.
+
+        Args:
+            city_id (str): City ID.
+
+        Returns:
+            list : Place objects linked to the City.
+        """
+        places = self.__places.get(city_id, {})
+        # Entries are checked against __objects, as objects can also be
+        # removed from it directly, and against city_id, as it can change
+        # after the place was indexed.
+        return [
+            place
+            for place in list(places.values())
+            if place.city_id == city_id and
+            self.__objects.get("Place." + place.id) is place
+        ]
 
     def close(self):
         """call reload() method for deserializing the JSON file to objects"""
@@ -87,13 +191,26 @@ class FileStorage:
             obj : Object based on cls and id,
                 or None if not found.
         """
-        retrieved_obj = None
-        new_dict = self.all(cls)
-        for obj in new_dict.values():
-            if obj.id == id:
-                retrieved_obj = obj
+        name = cls if isinstance(cls, str) else cls.__name__
+        return self.__objects.get(name + "." + str(id))
+
+    def get_many(self, cls, ids, load=()):
+        """Retrieve several objects of the same class.
+
+        Args:
+            cls (class): Class of the objects.
+            ids (list) : Object IDs.
+            load (tuple, optional): Relationships to load with the
+                objects. Unused, the related objects are already in
+                memory. Defaults to ().
 
-        return retrieved_obj
+        Returns:
+            list : Objects based on cls and ids. IDs not linked to any
+                object are skipped.
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        keys = (name + "." + str(id) for id in ids)
+        return [self.__objects[key] for key in keys if key in self.__objects]
 
     def count(self, cls=None):
         """count the number of object in storage
@@ -106,9 +223,51 @@ class FileStorage:
                 If no class is passed, returns the count of all objects in
                 storage.
         """
-        if cls:
-            count = len(self.all(cls).values())
-        else:
-            count = len(self.all().values())
+        if not cls:
+            return len(self.__objects)
+        prefix = (cls if isinstance(cls, str) else cls.__name__) + "."
+
+        return sum(1 for key in self.__objects if key.startswith(prefix))
+
+    def last_update(self, cls):
+        """count the objects of a class and find their last update
+
+        Args:
+            cls (class): Class.
+
+        Returns:
+            tuple : number of objects of the class and the most recent
+                updated_at among them, None if there is no object.
+        """
+        count = 0
+        last = None
+        for obj in self.iter(cls):
+            count += 1
+            if last is None or obj.updated_at > last:
+                last = obj.updated_at
+
+        return count, last
+
+    def keeps_microseconds(self, cls):
+        """tell whether the updated_at of a class keeps microseconds
+
+        Args:
+            cls (class): Class.
+
+        Returns:
+            bool : Always True, file.json stores the microseconds.
+        """
+        return True
+
+    def counts(self):
+        """count the number of objects of every class in one pass
+
+        Returns:
+            dict : number of objects in storage keyed by class name.
+        """
+        counts = dict.fromkeys(classes, 0)
+        for obj in self.__objects.values():
+            name = obj.__class__.__name__
+            counts[name] = counts.get(name, 0) + 1
 
-        return count
+        return counts
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Contains the TestCache class
+"""
+
+from api.v1 import views
+from api.v1.app import app
+from models.amenity import Amenity
+import unittest
+from unittest import mock
+
+
+class TestCache(unittest.TestCase):
+    """Test the cache of the GET views"""
+
+    def setUp(self):
+        """Start every test with an empty cache"""
+        views._cache = {}
+        self.client = app.test_client()
+
+    def get_names(self):
+        """Return the names listed by GET /amenities"""
+        response = self.client.get("/api/v1/amenities")
+        return {amenity["name"] for amenity in response.get_json()}
+
+    def test_hit(self):
+        """Test that a cached body is served within CACHE_TTL"""
+        names = self.get_names()
+        Amenity(name="Cache test hit").save()
+        self.assertEqual(self.get_names(), names)
+
+    def test_expiry(self):
+        """Test that a cached body is dropped after CACHE_TTL"""
+        with mock.patch("api.v1.views.time.monotonic") as monotonic:
+            monotonic.return_value = 1000.0
+            self.get_names()
+            Amenity(name="Cache test expiry").save()
+            monotonic.return_value = 1000.0 + views.CACHE_TTL
+            self.assertIn("Cache test expiry", self.get_names())
+
+    def test_clear_on_write(self):
+        """Test that POST, PUT and DELETE requests drop the cache"""
+        self.get_names()
+        response = self.client.post("/api/v1/amenities",
+                                    json={"name": "Cache test post"})
+        amenity_id = response.get_json()["id"]
+        self.assertIn("Cache test post", self.get_names())
+
+        self.client.put("/api/v1/amenities/" + amenity_id,
+                        json={"name": "Cache test put"})
+        names = self.get_names()
+        self.assertIn("Cache test put", names)
+        self.assertNotIn("Cache test post", names)
+
+        self.client.delete("/api/v1/amenities/" + amenity_id)
+        self.assertNotIn("Cache test put", self.get_names())
+
+    def test_stream(self):
+        """Test that a streamed body is only cached once it is sent"""
+        response = self.client.get("/api/v1/amenities")
+        self.assertTrue(response.is_streamed)
+        self.assertNotIn("/api/v1/amenities", views._cache)
+        body = response.get_data()
+        self.assertEqual(views._cache["/api/v1/amenities"][1], body)
+
+    def test_search_keeps_cache(self):
+        """Test that POST /places_search doesn't drop the cache"""
+        self.get_names()
+        self.client.get("/api/v1/stats")
+        response = self.client.post("/api/v1/places_search", json={})
+        response.get_data()
+        self.assertIn("/api/v1/amenities", views._cache)
+        self.assertIn("/api/v1/stats", views._cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""
+Contains the TestEtag class
+"""
+
+from api.v1 import views
+from api.v1.app import app
+from models import storage
+from models.state import State
+import unittest
+from unittest import mock
+
+
+@unittest.skipUnless(storage.keeps_microseconds(State),
+                     "updated_at doesn't keep microseconds")
+class TestEtag(unittest.TestCase):
+    """Test the ETags of the GET list views"""
+
+    def setUp(self):
+        """Create a test client"""
+        self.client = app.test_client()
+
+    def get_etag(self, **kwargs):
+        """Return the response of GET /states, with its body read"""
+        response = self.client.get("/api/v1/states", **kwargs)
+        response.get_data()
+        return response
+
+    def test_not_modified(self):
+        """Test that a matching If-None-Match is answered with 304"""
+        etag = self.get_etag().headers["ETag"]
+        response = self.get_etag(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.get_data(), b"")
+
+    def test_changes_on_write(self):
+        """Test that POST, PUT and DELETE requests change the ETag"""
+        etags = [self.get_etag().headers["ETag"]]
+        response = self.client.post("/api/v1/states",
+                                    json={"name": "Etag test post"})
+        state_id = response.get_json()["id"]
+        etags.append(self.get_etag().headers["ETag"])
+        self.client.put("/api/v1/states/" + state_id,
+                        json={"name": "Etag test put"})
+        etags.append(self.get_etag().headers["ETag"])
+        self.client.delete("/api/v1/states/" + state_id)
+        etags.append(self.get_etag().headers["ETag"])
+        for before, after in zip(etags, etags[1:]):
+            self.assertNotEqual(before, after)
+
+        response = self.get_etag(headers={"If-None-Match": etags[2]})
+        self.assertEqual(response.status_code, 200)
+
+    def test_no_etag_on_error(self):
+        """Test that an error response of the view is not tagged"""
+        view = views.etagged(State)(
+            mock.Mock(return_value=({"error": "Not found"}, 404))
+        )
+        with app.test_request_context("/api/v1/states"):
+            response = view()
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(response.headers.get("ETag"))
+
+    def test_view_not_called(self):
+        """Test that the view is not called when answering 304"""
+        etag = self.get_etag().headers["ETag"]
+        view = mock.Mock(return_value=([], 200))
+        with app.test_request_context("/api/v1/states",
+                                      headers={"If-None-Match": etag}):
+            response = views.etagged(State)(view)()
+        self.assertEqual(response.status_code, 304)
+        view.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
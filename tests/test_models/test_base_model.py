@@ -138,6 +138,16 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(new_d["created_at"], bm.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], bm.updated_at.strftime(t_format))
 
+    def test_to_dict_after_update(self):
+        """test that to_dict reflects attributes set after a first call"""
+        bm = BaseModel()
+        bm.name = "Holberton"
+        first = bm.to_dict()
+        first["name"] = "Changed"
+        self.assertEqual(bm.to_dict()["name"], "Holberton")
+        bm.name = "School"
+        self.assertEqual(bm.to_dict()["name"], "School")
+
     def test_str(self):
         """test that the str method has the correct output"""
         inst = BaseModel()
@@ -14,8 +14,10 @@ from models.review import Review
 from models.state import State
 from models.user import User
 import json
+import os
 import pep8
 import unittest
+from unittest import mock
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -76,6 +78,77 @@ class TestFileStorage(unittest.TestCase):
         self.assertEqual(type(new_dict), dict)
         self.assertIs(new_dict, storage._FileStorage__objects)
 
+    def test_iter(self):
+        """Test that iter yields the objects of all or of the given class"""
+        storage = FileStorage()
+        State(name="FileStorage test iter").save()
+
+        self.assertCountEqual(list(storage.iter()),
+                              list(storage.all().values()))
+        self.assertCountEqual(list(storage.iter(State)),
+                              list(storage.all(State).values()))
+
+    def test_city_places(self):
+        """Test that city_places returns the places indexed by city"""
+        storage = FileStorage()
+        city = City(name="FileStorage test city_places")
+        place = Place(city_id=city.id, name="Place")
+        self.assertEqual(storage.city_places(city.id), [])
+        place.save()
+        self.assertEqual(storage.city_places(city.id), [place])
+        self.assertEqual(city.places, [place])
+        storage.delete(place)
+        self.assertEqual(storage.city_places(city.id), [])
+
+    def test_last_update(self):
+        """Test that last_update returns the count and last updated_at"""
+        storage = FileStorage()
+        state = State(name="FileStorage test last_update")
+        state.save()
+        count, last = storage.last_update(State)
+        self.assertEqual(count, storage.count(State))
+        self.assertGreaterEqual(last, state.updated_at)
+
+    def test_last_update_same_second(self):
+        """Test that last_update changes with every update, even when the
+        updates happen within the same second"""
+        storage = FileStorage()
+        state = State(name="FileStorage test last_update")
+        state.save()
+        lasts = [storage.last_update(State)]
+        for name in ("First", "Second"):
+            storage.update(state, {"name": name})
+            lasts.append(storage.last_update(State))
+        self.assertEqual(len(set(lasts)), 3)
+
+    def test_update(self):
+        """Test that update sets the values and saves the object"""
+        storage = FileStorage()
+        state = State(name="FileStorage test update")
+        state.save()
+        updated_at = state.updated_at
+        storage.update(state, {"name": "Updated"})
+        self.assertEqual(state.name, "Updated")
+        self.assertEqual(state.to_dict()["name"], "Updated")
+        self.assertNotEqual(state.updated_at, updated_at)
+        self.assertEqual(storage.get(State, state.id).name, "Updated")
+
+    def test_iter_dicts(self):
+        """Test that iter_dicts yields the to_dict of the class objects"""
+        storage = FileStorage()
+        state = State(name="FileStorage test iter_dicts")
+        state.save()
+        user = User(email="a@b.c", password="pwd")
+        user.save()
+
+        states = {d["id"]: d for d in storage.iter_dicts(State)}
+        self.assertEqual(states[state.id]["__class__"], "State")
+        self.assertEqual(states[state.id]["name"], state.name)
+        self.assertEqual(states[state.id]["created_at"],
+                         state.to_dict()["created_at"])
+        users = {d["id"]: d for d in storage.iter_dicts(User)}
+        self.assertNotIn("password", users[user.id])
+
     def test_new(self):
         """test that new adds an object to the FileStorage.__objects attr"""
         storage = FileStorage()
@@ -110,6 +183,67 @@ class TestFileStorage(unittest.TestCase):
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
 
+    def test_reload_unchanged_file(self):
+        """Test that reload keeps the objects when file.json is unchanged"""
+        storage = FileStorage()
+        state = State(name="FileStorage test reload")
+        state.save()
+        storage.reload()
+        obj = storage.get(State, state.id)
+        storage.reload()
+        self.assertIs(storage.get(State, state.id), obj)
+
+    def test_reload_changed_file(self):
+        """Test that reload picks up a same-size rewrite of file.json"""
+        storage = FileStorage()
+        state = State(name="CA")
+        state.save()
+        storage.reload()
+        stat = os.stat("file.json")
+        with open("file.json", "r") as f:
+            content = json.load(f)
+        content["State." + state.id]["name"] = "NV"
+        with open("file.json", "w") as f:
+            json.dump(content, f, indent=4)
+        # Same size and modification time, as for a rewrite within the
+        # timestamp granularity of the filesystem.
+        self.assertEqual(os.stat("file.json").st_size, stat.st_size)
+        os.utime("file.json", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        storage.reload()
+        self.assertEqual(storage.get(State, state.id).name, "NV")
+
+    def test_reload_unsaved_change(self):
+        """Test that reload restores an object changed but not saved"""
+        storage = FileStorage()
+        state = State(name="CA")
+        state.save()
+        storage.reload()
+        obj = storage.get(State, state.id)
+        with mock.patch.object(FileStorage, "save", side_effect=OSError):
+            with self.assertRaises(OSError):
+                storage.update(obj, {"name": "HACK"})
+        self.assertEqual(storage.get(State, state.id).name, "HACK")
+        storage.reload()
+        self.assertEqual(storage.get(State, state.id).name, "CA")
+        storage.save()
+        with open("file.json", "r") as f:
+            self.assertEqual(json.load(f)["State." + state.id]["name"], "CA")
+
+    def test_keeps_microseconds(self):
+        """Test that file storage keeps the microseconds of updated_at"""
+        self.assertTrue(FileStorage().keeps_microseconds(State))
+
+    def test_delete_commit(self):
+        """Test that delete with commit removes the object from file.json"""
+        storage = FileStorage()
+        state = State(name="FileStorage test delete")
+        state.save()
+        key = "State." + state.id
+        storage.delete(state, commit=True)
+        self.assertNotIn(key, storage.all())
+        with open("file.json", "r") as f:
+            self.assertNotIn(key, json.load(f))
+
     def test_get(self):
         """Test the get method of FileStorage"""
         storage = FileStorage()
@@ -123,6 +257,19 @@ class TestFileStorage(unittest.TestCase):
         none_state = storage.get(State, "1234")
         self.assertFalse(none_state)
 
+    def test_get_many(self):
+        """Test the get_many method of FileStorage"""
+        storage = FileStorage()
+
+        state1 = State(name="FileStorage test get_many")
+        state1.save()
+        state2 = State(name="FileStorage test get_many")
+        state2.save()
+
+        states = storage.get_many(State, [state1.id, "1234", state2.id])
+        self.assertEqual(states, [state1, state2])
+        self.assertEqual(storage.get_many(State, []), [])
+
     def test_count(self):
         """Test the count method of FileStorage"""
 
@@ -139,3 +286,19 @@ class TestFileStorage(unittest.TestCase):
         count4 = storage.count(State)
 
         self.assertEqual(count3 + 1, count4)
+
+    def test_counts(self):
+        """Test the counts method of FileStorage"""
+
+        storage = FileStorage()
+
+        counts1 = storage.counts()
+        for name in classes:
+            with self.subTest(name=name):
+                self.assertEqual(counts1[name], storage.count(name))
+
+        State(name="Test counts").save()
+        counts2 = storage.counts()
+
+        self.assertEqual(counts1["State"] + 1, counts2["State"])
+        self.assertEqual(counts1["City"], counts2["City"])
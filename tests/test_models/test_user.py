@@ -85,6 +85,22 @@ class TestUser(unittest.TestCase):
         else:
             self.assertEqual(user.password, "")
 
+    def test_password_hashed(self):
+        """Test that a new User stores a salted hash of the password"""
+        user1 = User(password="1234")
+        user2 = User(password="1234")
+        self.assertTrue(user1.password.startswith("pbkdf2_sha256$"))
+        self.assertNotEqual(user1.password, user2.password)
+        self.assertLessEqual(len(user1.password), 128)
+        reloaded = User(**user1.to_dict(password=True))
+        self.assertEqual(reloaded.password, user1.password)
+
+    def test_password_hashed_with_created_at(self):
+        """Test that a password in clear text is hashed even when
+        created_at is passed"""
+        user = User(password="secret", created_at="2020-01-01T00:00:00.000000")
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$"))
+
     def test_first_name_attr(self):
         """Test that User has attr first_name, and it's an empty string"""
         user = User()
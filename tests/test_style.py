@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+"""
+Contains the TestStyle class
+
+The style checks are slow, so they only run when RUN_STYLE is set in
+the environment, once for the whole suite.
+"""
+
+import os
+import unittest
+
+FILES = [
+    "models/engine/db_storage.py",
+    "tests/test_models/test_engine/test_db_storage.py",
+    "tests/test_models/test_engine/test_engine/test_db_storage.py",
+]
+
+
+@unittest.skipUnless(os.environ.get("RUN_STYLE"), "RUN_STYLE is not set")
+class TestStyle(unittest.TestCase):
+    """Tests to check the code style of the project"""
+
+    def test_pep8_conformance(self):
+        """Test that the files conform to PEP8."""
+        import pep8
+
+        pep8s = pep8.StyleGuide(quiet=True)
+        for path in FILES:
+            with self.subTest(path=path):
+                result = pep8s.check_files([path])
+                self.assertEqual(result.total_errors, 0,
+                                 "Found code style errors (and warnings).")